@@ -17,6 +17,7 @@ def main():
     #如把上面两个改成True的话,windows客户端(资源管理器)将无法工作。
     #handler.masquerade_address = '185.161.70.200'#windows资源管理器下不能开启这个!!!!!
     handler.passive_ports = range(3000,4000)
+    handler.dtp_handler.ac_in_buffer_size = 1024 * 1024
     server = FTPServer(('0.0.0.0', 21), handler)
     server.serve_forever()
 if __name__ == '__main__':